@@ -17,4 +17,5 @@ setuptools.setup(
     license="MIT",
     packages=find_packages(),
     install_requires=["aiohttp>=3.7.2,<4.0.0"],
+    extras_require={"fast": ["orjson"]},
 )
@@ -1,4 +1,3 @@
-import json
 import typing
 from http import HTTPStatus
 
@@ -6,32 +5,77 @@ import aiohttp
 import logging
 from .types import exceptions
 
+try:
+    import orjson
+except ImportError:
+    import json
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
+
+    _loads = json.loads
+else:
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+
 TEXTIT_API_URL = "https://textit.ego-ai.tech/api/1.0/data"
 log = logging.getLogger("textIT")
 
+_OK = HTTPStatus.OK.value
+_IM_USED = HTTPStatus.IM_USED.value
+_INTERNAL_SERVER_ERROR = HTTPStatus.INTERNAL_SERVER_ERROR.value
+
+_CONTENT_TYPES = frozenset({"text/html", "application/json"})
+_STATUS_ERRORS = {
+    HTTPStatus.BAD_REQUEST.value: (
+        exceptions.BadRequest,
+        "Bad response from API server",
+    ),
+    HTTPStatus.NOT_FOUND.value: (exceptions.NotFound, "Target server not found"),
+    HTTPStatus.CONFLICT.value: (
+        exceptions.Conflict,
+        "Is there conflict while getting response",
+    ),
+    HTTPStatus.UNAUTHORIZED.value: (
+        exceptions.Unauthorized,
+        "The server did not accept the request",
+    ),
+    HTTPStatus.FORBIDDEN.value: (
+        exceptions.Unauthorized,
+        "The server did not accept the request",
+    ),
+}
 
-def check_result(content_type: str, status_code: int, body: str):
+
+def _decode(body: typing.Union[bytes, str]) -> str:
+    if isinstance(body, bytes):
+        return body.decode("utf-8", "replace")
+    return body
+
+
+def check_result(content_type: str, status_code: int, body: typing.Union[bytes, str]):
     """
     Checks whether result is a valid API response.
     A result is considered invalid if:
     - The server returned an HTTP response code other than 200
-    - The content of the result has content type other than text/html.
+    - The content of the result has content type other than text/html or JSON.
     - The method call was unsuccessful (The JSON 'error' field exists)
 
     :param content_type: content type of result
     :param status_code: status code
-    :param body: result body
+    :param body: raw result body
     :return: The result parsed to a JSON dictionary
     :raises APIError: if one of the above listed cases is applicable
     """
-    log.debug('Response: [%d] "%r"', status_code, body)
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug('Response: [%d] "%r"', status_code, body)
 
-    if content_type != "text/html":
+    if content_type not in _CONTENT_TYPES:
         raise exceptions.NetworkError(
-            f'Invalid response with content type {content_type}: "{body}"'
+            f'Invalid response with content type {content_type}: "{_decode(body)}"'
         )
     try:
-        result_json = json.loads(body)
+        result_json = _loads(body)
     except ValueError:
         result_json = {}
 
@@ -40,17 +84,15 @@ def check_result(content_type: str, status_code: int, body: str):
         if error:
             raise exceptions.APIError(f"{error.get('message')} [{error.get('status')}]")
 
-    if HTTPStatus.OK <= status_code <= HTTPStatus.IM_USED:
+    if _OK <= status_code <= _IM_USED:
         return result_json
-    elif status_code == HTTPStatus.BAD_REQUEST:
-        raise exceptions.BadRequest(f"Bad response from API server: {body}")
-    elif status_code == HTTPStatus.NOT_FOUND:
-        raise exceptions.NotFound(f"Target server not found: {body}")
-    elif status_code == HTTPStatus.CONFLICT:
-        raise exceptions.Conflict(f"Is there conflict while getting response: {body}")
-    elif status_code in (HTTPStatus.UNAUTHORIZED, HTTPStatus.FORBIDDEN):
-        raise exceptions.Unauthorized(f"The server did not accept the request: {body}")
-    elif status_code >= HTTPStatus.INTERNAL_SERVER_ERROR:
+
+    body = _decode(body)
+    error = _STATUS_ERRORS.get(status_code)
+    if error is not None:
+        exception, message = error
+        raise exception(f"{message}: {body}")
+    if status_code >= _INTERNAL_SERVER_ERROR:
         raise exceptions.APIError(f"Some error while getting response: {body}")
     raise exceptions.APIError(f"{body} [{status_code}]")
 
@@ -67,11 +109,16 @@ async def make_request(
     :return: response from API
     :raises NetworkError: if there is some error caused by aiohttp
     """
-    log.debug('Make request with payload: "%r"', payload)
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug('Make request with payload: "%r"', payload)
     try:
-        async with session.post(TEXTIT_API_URL, data=str(payload)) as response:
+        async with session.post(
+            TEXTIT_API_URL,
+            data=_dumps(payload),
+            headers={"Content-Type": "application/json"},
+        ) as response:
             return check_result(
-                response.content_type, response.status, await response.text()
+                response.content_type, response.status, await response.read()
             )
     except aiohttp.ClientError as e:
         raise exceptions.NetworkError(
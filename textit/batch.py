@@ -0,0 +1,101 @@
+import asyncio
+import typing
+
+from .types import exceptions
+
+
+class BatchScheduler:
+    """
+    Collects single commands into batch requests
+
+    A batch is sent as soon as it reaches the maximum size
+    or when the oldest command has waited for the maximum latency
+    """
+
+    def __init__(
+        self,
+        process_batch: typing.Callable[[typing.List], typing.Awaitable[typing.List]],
+        max_batch_size: int = 50,
+        max_latency: float = 0.01,
+    ):
+        """
+        :param process_batch: coroutine function that sends a list of commands
+            and returns the list of their responses
+        :param max_batch_size: maximum number of commands in one request
+        :type max_batch_size: int
+        :param max_latency: maximum time in seconds a command waits for a batch
+        :type max_latency: float
+        """
+        self.process_batch = process_batch
+        self.max_batch_size = max_batch_size
+        self.max_latency = max_latency
+        self._queue = []
+        self._timer = None
+        self._tasks = set()
+
+    def submit(self, command: typing.Dict) -> asyncio.Future:
+        """
+        Adds a command to the current batch
+
+        :param command: command to send
+        :type command: typing.Dict
+        :return: future with API response for the command
+        :rtype: asyncio.Future
+        """
+        loop = asyncio.get_event_loop()
+        future = loop.create_future()
+        self._queue.append((command, future))
+        if len(self._queue) >= self.max_batch_size:
+            self.flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_latency, self.flush)
+        return future
+
+    def flush(self):
+        """
+        Sends the current batch without waiting
+        """
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._queue:
+            return
+        batch, self._queue = self._queue, []
+        task = asyncio.ensure_future(self._process(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def close(self):
+        """
+        Sends the current batch and waits for all batches in progress
+        """
+        self.flush()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def _process(
+        self, batch: typing.List[typing.Tuple[typing.Dict, asyncio.Future]]
+    ):
+        try:
+            responses = await self.process_batch([command for command, _ in batch])
+        except asyncio.CancelledError:
+            for _, future in batch:
+                future.cancel()
+            raise
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        responses = responses or []
+        for i, (_, future) in enumerate(batch):
+            if future.done():
+                continue
+            if i < len(responses):
+                future.set_result(responses[i])
+            else:
+                future.set_exception(
+                    exceptions.BatchProcessingError(
+                        "API returned fewer responses than commands were sent"
+                    )
+                )
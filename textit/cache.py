@@ -0,0 +1,94 @@
+import asyncio
+import functools
+import time
+import typing
+from collections import OrderedDict
+
+_MISSING = object()
+
+
+class ResponseCache:
+    """
+    LRU cache for API responses
+
+    Concurrent requests for the same key are coalesced,
+    so only one of them actually reaches the API server
+    """
+
+    def __init__(self, maxsize: int = 10000, ttl: typing.Optional[float] = None):
+        """
+        :param maxsize: maximum number of cached responses
+        :type maxsize: int
+        :param ttl: lifetime of a cached response in seconds. Default - unlimited
+        :type ttl: typing.Optional[float]
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._pending = {}
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: typing.Hashable, default=None):
+        """
+        Gets a cached response and marks it as recently used
+
+        :param key: cache key
+        :param default: value to return if there is no valid response
+        :return: cached response
+        """
+        item = self._data.get(key, _MISSING)
+        if item is _MISSING:
+            return default
+        value, expires = item
+        if expires is not None and expires < time.monotonic():
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: typing.Hashable, value):
+        """
+        Stores a response, evicting the least recently used one if necessary
+
+        :param key: cache key
+        :param value: response to store
+        """
+        expires = time.monotonic() + self.ttl if self.ttl is not None else None
+        self._data[key] = (value, expires)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self):
+        """
+        Removes all cached responses
+        """
+        self._data.clear()
+
+    async def fetch(
+        self, key: typing.Hashable, factory: typing.Callable[[], typing.Awaitable]
+    ):
+        """
+        Gets a cached response or fetches a new one.
+        If the same key is already being fetched, waits for that request instead
+
+        :param key: cache key
+        :param factory: function that returns an awaitable with a fresh response
+        :return: response
+        """
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+        task = self._pending.get(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            self._pending[key] = task
+            task.add_done_callback(functools.partial(self._on_fetched, key))
+        return await asyncio.shield(task)
+
+    def _on_fetched(self, key: typing.Hashable, task: asyncio.Future):
+        self._pending.pop(key, None)
+        if not task.cancelled() and task.exception() is None:
+            self.set(key, task.result())
@@ -1,33 +1,162 @@
+import asyncio
+import functools
 import typing
 
 import aiohttp
 
 from .api import make_request
+from .batch import BatchScheduler
+from .cache import ResponseCache
 from .types import exceptions
 from .types.base import APIMethod
 from .types.numeral import *
 from .types.speller import *
 from .types.word import *
 from .utils import (
+    command_builder,
     generate_command,
     choose_response,
     generate_payload,
-    get_func_list,
-    sign_responses,
+    sign_responses_from_commands,
 )
 
 
+USER_AGENT = "textit-api/0.0.2"
+
+_CORRECT = APIMethod.CORRECT
+_HINT = APIMethod.HINT
+_NUMERAL = APIMethod.NUMERAL
+_SPELLER = APIMethod.SPELLER
+_WORD = APIMethod.WORD
+_SET_FORM = APIMethod.SET_FORM
+_COGNATE = APIMethod.COGNATE
+_SYNONYM = APIMethod.SYNONYM
+_LAT_TO_CYR = APIMethod.LAT_TO_CYR
+
+_correct_command = command_builder(_CORRECT, "word")
+_hint_command = command_builder(_HINT, "text")
+_speller_command = command_builder(_SPELLER, "text")
+_word_command = command_builder(_WORD, "word")
+_cognate_command = command_builder(_COGNATE, "word")
+_synonym_command = command_builder(_SYNONYM, "word")
+_lat_to_cyr_command = command_builder(_LAT_TO_CYR, "text")
+
+
 class TextIT:
-    def __init__(self, session: aiohttp.ClientSession = None):
+    # return an empty result for empty or whitespace-only input
+    # without making a request to the API
+    skip_empty: bool = True
+
+    def __init__(
+        self,
+        session: aiohttp.ClientSession = None,
+        cache_size: int = 10000,
+        cache_ttl: typing.Optional[float] = None,
+        batch_size: int = 0,
+        batch_latency: float = 0.01,
+    ):
+        """
+        :param session: aiohttp session to use. Default - own pooled session
+        :type session: aiohttp.ClientSession
+        :param cache_size: maximum number of cached responses, 0 disables caching
+        :type cache_size: int
+        :param cache_ttl: lifetime of a cached response in seconds. Default - unlimited
+        :type cache_ttl: typing.Optional[float]
+        :param batch_size: maximum number of concurrent calls merged into one request,
+            0 disables automatic batching
+        :type batch_size: int
+        :param batch_latency: maximum time in seconds a call waits for other calls
+            to be merged with
+        :type batch_latency: float
+        """
         self._session = session
+        self._own_session = session is None
+        self._cache = ResponseCache(cache_size, cache_ttl) if cache_size > 0 else None
+        self._batcher = (
+            BatchScheduler(self._send_batch, batch_size, batch_latency)
+            if batch_size > 0
+            else None
+        )
         self.request = []
+        self._follow_ups = {}
+
+    async def __aenter__(self) -> "TextIT":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
 
     @property
     def session(self) -> typing.Optional[aiohttp.ClientSession]:
+        """
+        Shared aiohttp session.
+        All requests go to the same host, so the session is created once
+        with a keep-alive connection pool and reused by every API call
+        """
         if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession()
+            connector = aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=32,
+                keepalive_timeout=75,
+                enable_cleanup_closed=True,
+                ttl_dns_cache=300,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector, headers={"User-Agent": USER_AGENT}
+            )
+            self._own_session = True
         return self._session
 
+    async def close(self):
+        """
+        Closes the session created by the client with all pooled connections.
+        A session passed to the constructor is left open
+        """
+        if self._batcher is not None:
+            await self._batcher.close()
+        if self._own_session and self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    async def _call(self, command: typing.Dict, cached: bool = False):
+        """
+        Sends a single command to the API
+
+        :param command: command to send
+        :type command: typing.Dict
+        :param cached: whether the response may be taken from the cache
+        :type cached: bool
+        :return: API response for the command
+        """
+        if cached and self._cache is not None:
+            return await self._cache.fetch(
+                _cache_key(command), functools.partial(self._send, command)
+            )
+        return await self._send(command)
+
+    async def _send(self, command: typing.Dict):
+        """
+        Makes a request with a single command.
+        If automatic batching is enabled, the command is merged with concurrent ones
+
+        :param command: command to send
+        :type command: typing.Dict
+        :return: API response for the command
+        """
+        if self._batcher is not None:
+            return await self._batcher.submit(command)
+        response = await make_request(self.session, generate_payload(command))
+        return response[0] if response else None
+
+    async def _send_batch(self, commands: typing.List[typing.Dict]) -> typing.List:
+        """
+        Makes a request with several commands
+
+        :param commands: commands to send
+        :type commands: typing.List[typing.Dict]
+        :return: list of API responses
+        """
+        return await make_request(self.session, generate_payload(commands))
+
     async def correct(
         self, word: str, immediately: bool = True
     ) -> typing.Optional[typing.List[WordObject]]:
@@ -42,15 +171,14 @@ class TextIT:
         :rtype: typing.Optional[typing.List[WordObject]]
         :raises ALotOfWords: if more than one word was specified
         """
-        if len(word.split(" ")) > 1:
-            raise exceptions.ALotOfWords(
-                "API doesn't support phrases of more than one word"
-            )
-        command = generate_command(func=APIMethod.CORRECT, pars={"word": word})
+        _check_word(word)
+        command = _correct_command(word)
         if not immediately:
             return self.request.append(command)
-        response = await make_request(self.session, generate_payload(command))
-        return [WordObject(**word) if word else None for word in response[0]]
+        if self.skip_empty and not word.strip():
+            return []
+        response = await self._call(command, cached=True)
+        return [WordObject.from_dict(word) if word else None for word in response]
 
     async def hint(
         self, text: str, immediately: bool = True
@@ -66,13 +194,14 @@ class TextIT:
         :rtype: typing.Optional[typing.List[WordObject]]
         :raises ToLongText: if the text is longer than 30 characters
         """
-        if len(text) > 30:
-            raise exceptions.ToLongText("Maximum length of text is 30 characters")
-        command = generate_command(func=APIMethod.HINT, pars={"text": text})
+        _check_text(text, 30)
+        command = _hint_command(text)
         if not immediately:
             return self.request.append(command)
-        response = await make_request(self.session, generate_payload(command))
-        return [WordObject(**word) if word else None for word in response[0]]
+        if self.skip_empty and not text.strip():
+            return []
+        response = await self._call(command, cached=True)
+        return [WordObject.from_dict(word) if word else None for word in response]
 
     async def numeral(
         self,
@@ -109,12 +238,9 @@ class TextIT:
 
         if number < 0:
             raise exceptions.NegativeNumber("Negative number aren't allowed")
-        if len(word.split(" ")) > 1:
-            raise exceptions.ALotOfWords(
-                "API doesn't support phrases of more than one word"
-            )
+        _check_word(word)
         command = generate_command(
-            func=APIMethod.NUMERAL,
+            func=_NUMERAL,
             pars={
                 "number": number,
                 "word": word,
@@ -126,12 +252,12 @@ class TextIT:
         )
         if not immediately:
             return self.request.append(command)
-        response = await make_request(self.session, generate_payload(command))
-        probable_response = choose_response(response[0])
-        return NumeralObject(**probable_response) if probable_response else None
+        response = await self._call(command)
+        probable_response = choose_response(response)
+        return NumeralObject.from_dict(probable_response) if probable_response else None
 
     async def speller(
-        self, text: str, immediately: bool = True
+        self, text: str, immediately: bool = True, add_correct: bool = False
     ) -> typing.Optional[SpellerObject]:
         """
         Checks the text for errors
@@ -140,17 +266,23 @@ class TextIT:
         :type text: str
         :param immediately: immediately send request. Default - True
         :type immediately: bool
+        :param add_correct: also fill in variants of the correct word. Default - False
+        :type add_correct: bool
         :return: speller object with founded and error and position in text (e.g. тектса and 8)
         :rtype: typing.Optional[SpellerObject]
         :raises ToLongText: if the text is longer than 10000 characters
         """
-        if len(text) > 10000:
-            raise exceptions.ToLongText("Maximum length of text is 10000 characters")
-        command = generate_command(func=APIMethod.SPELLER, pars={"text": text})
+        _check_text(text, 10000)
+        command = _speller_command(text)
         if not immediately:
+            if add_correct:
+                self._follow_ups[len(self.request)] = self._add_correct
             return self.request.append(command)
-        response = await make_request(self.session, generate_payload(command))
-        return SpellerObject(**response[0]) if response else None
+        if self.skip_empty and not text.strip():
+            return None
+        response = await self._call(command)
+        result = SpellerObject.from_dict(response) if response else None
+        return await self._add_correct(result) if add_correct else result
 
     async def word_info(
         self, word: str, immediately: bool = True
@@ -168,16 +300,15 @@ class TextIT:
         :rtype: typing.Optional[WordObject]
         :raises ALotOfWords: if more than one word was specified
         """
-        if len(word.split(" ")) > 1:
-            raise exceptions.ALotOfWords(
-                "API doesn't support phrases of more than one word"
-            )
-        command = generate_command(func=APIMethod.WORD, pars={"word": word})
+        _check_word(word)
+        command = _word_command(word)
         if not immediately:
             return self.request.append(command)
-        response = await make_request(self.session, generate_payload(command))
-        probable_response = choose_response(response[0])
-        return WordObject(**probable_response) if probable_response else None
+        if self.skip_empty and not word.strip():
+            return None
+        response = await self._call(command, cached=True)
+        probable_response = choose_response(response)
+        return WordObject.from_dict(probable_response) if probable_response else None
 
     async def set_form(
         self,
@@ -191,6 +322,7 @@ class TextIT:
         form: typing.Optional[WordForm] = None,
         kind: typing.Optional[WordKind] = None,
         immediately: bool = True,
+        add_info: bool = False,
     ) -> typing.Optional[WordObject]:
         """
         Returns the original word in the desired word form (number, gender, case, etc.)
@@ -215,16 +347,16 @@ class TextIT:
         :type kind: typing.Optional[WordKind]
         :param immediately: immediately send request. Default - True
         :type immediately: bool
+        :param add_info: fill in missing information about the word in required form.
+            Default - False
+        :type add_info: bool
         :return: word object in required form
         :rtype: typing.Optional[WordObject]
         :raises ALotOfWords: if more than one word was specified
         """
-        if len(word.split(" ")) > 1:
-            raise exceptions.ALotOfWords(
-                "API doesn't support phrases of more than one word"
-            )
+        _check_word(word)
         command = generate_command(
-            func=APIMethod.SET_FORM,
+            func=_SET_FORM,
             pars={
                 "word": word,
                 "part": part,
@@ -238,10 +370,15 @@ class TextIT:
             },
         )
         if not immediately:
+            if add_info:
+                self._follow_ups[len(self.request)] = self._add_info
             return self.request.append(command)
-        response = await make_request(self.session, generate_payload(command))
-        probable_response = choose_response(response[0])
-        return WordObject(**probable_response) if probable_response else None
+        if self.skip_empty and not word.strip():
+            return None
+        response = await self._call(command)
+        probable_response = choose_response(response)
+        result = WordObject.from_dict(probable_response) if probable_response else None
+        return await self._add_info(result) if add_info else result
 
     async def cognate(
         self, word: str, immediately: bool = True
@@ -257,15 +394,14 @@ class TextIT:
         :rtype: typing.Optional[typing.List[WordObject]]
         :raises ALotOfWords: if more than one word was specified
         """
-        if len(word.split(" ")) > 1:
-            raise exceptions.ALotOfWords(
-                "API doesn't support phrases of more than one word"
-            )
-        command = generate_command(func=APIMethod.COGNATE, pars={"word": word})
+        _check_word(word)
+        command = _cognate_command(word)
         if not immediately:
             return self.request.append(command)
-        response = await make_request(self.session, generate_payload(command))
-        return [WordObject(**word) if word else None for word in response[0]]
+        if self.skip_empty and not word.strip():
+            return []
+        response = await self._call(command, cached=True)
+        return [WordObject.from_dict(word) if word else None for word in response]
 
     async def synonym(
         self, word: str, immediately: bool = True
@@ -281,15 +417,14 @@ class TextIT:
         :rtype: typing.Optional[typing.List[WordObject]]
         :raises ALotOfWords: if more than one word was specified
         """
-        if len(word.split(" ")) > 1:
-            raise exceptions.ALotOfWords(
-                "API doesn't support phrases of more than one word"
-            )
-        command = generate_command(func=APIMethod.SYNONYM, pars={"word": word})
+        _check_word(word)
+        command = _synonym_command(word)
         if not immediately:
             return self.request.append(command)
-        response = await make_request(self.session, generate_payload(command))
-        return [WordObject(**word) if word else None for word in response[0]]
+        if self.skip_empty and not word.strip():
+            return []
+        response = await self._call(command, cached=True)
+        return [WordObject.from_dict(word) if word else None for word in response]
 
     async def lat_to_cyr(
         self, text: str, immediately: bool = True
@@ -306,13 +441,14 @@ class TextIT:
         :raises ToLongText: if the text is longer than 10000 characters
         """
 
-        if len(text) > 10000:
-            raise exceptions.ToLongText("Maximum length of text is 10000 characters")
-        command = generate_command(func=APIMethod.LAT_TO_CYR, pars={"text": text})
+        _check_text(text, 10000)
+        command = _lat_to_cyr_command(text)
         if not immediately:
             return self.request.append(command)
-        response = await make_request(self.session, generate_payload(command))
-        return response[0][0].get("text")
+        if self.skip_empty and not text.strip():
+            return text
+        response = await self._call(command, cached=True)
+        return response[0].get("text")
 
     async def send_request(self):
         """
@@ -325,15 +461,134 @@ class TextIT:
             raise exceptions.BatchProcessingError(
                 "Empty request list for batch processing"
             )
-        func_list = get_func_list(self.request)
-        payload = generate_payload(self.request)
+        commands = self.request
+        follow_ups = self._follow_ups
         self.request = []
-        responses = await make_request(self.session, payload)
-        signed_responses = sign_responses(func_list, responses)
-        return [
+        self._follow_ups = {}
+        responses = await make_request(self.session, generate_payload(commands))
+        signed_responses = sign_responses_from_commands(commands, responses)
+        results = [
             _wrap_response(signed_response.get("func"), signed_response.get("response"))
             for signed_response in signed_responses
         ]
+        if follow_ups:
+            indexes = list(follow_ups)
+            completed = await asyncio.gather(
+                *[follow_ups[i](results[i]) for i in indexes]
+            )
+            for i, result in zip(indexes, completed):
+                results[i] = result
+        return results
+
+    async def _add_correct(
+        self, result: typing.Optional[SpellerObject]
+    ) -> typing.Optional[SpellerObject]:
+        """
+        Fills in variants of the correct word for a speller result
+
+        :param result: speller result
+        :type result: typing.Optional[SpellerObject]
+        :return: the same speller result
+        :rtype: typing.Optional[SpellerObject]
+        """
+        if result is not None:
+            result.correct = await self.correct(result.word)
+        return result
+
+    async def _add_info(
+        self, result: typing.Optional[WordObject]
+    ) -> typing.Optional[WordObject]:
+        """
+        Fills in the fields of a set_form result that the API left empty.
+        Fields already set by set_form are kept, so the requested form is preserved
+
+        :param result: set_form result
+        :type result: typing.Optional[WordObject]
+        :return: the same word object with information
+        :rtype: typing.Optional[WordObject]
+        """
+        if result is None:
+            return None
+        info = await self.word_info(result.word)
+        if info is not None:
+            result.fill_missing(info)
+        return result
+
+
+def _check_word(word: str):
+    """
+    Local method to check that a single word was specified
+
+    :param word: word to check
+    :type word: str
+    :raises ALotOfWords: if more than one word was specified
+    """
+    if " " in word:
+        raise exceptions.ALotOfWords(
+            "API doesn't support phrases of more than one word"
+        )
+
+
+def _check_text(text: str, max_length: int):
+    """
+    Local method to check the length of a text
+
+    :param text: text to check
+    :type text: str
+    :param max_length: maximum number of characters
+    :type max_length: int
+    :raises ToLongText: if the text is longer than max_length characters
+    """
+    if len(text) > max_length:
+        raise exceptions.ToLongText(
+            f"Maximum length of text is {max_length} characters"
+        )
+
+
+def _cache_key(command: typing.Dict) -> typing.Hashable:
+    """
+    Local method to build a cache key for a command
+
+    :param command: API command
+    :type command: typing.Dict
+    :return: hashable key
+    """
+    return command.get("func"), frozenset(command.get("pars", {}).items())
+
+
+def _wrap_words(response: typing.List) -> typing.Optional[typing.List[WordObject]]:
+    if not response:
+        return None
+    return [WordObject.from_dict(word) if word else None for word in response]
+
+
+def _wrap_word(response: typing.List) -> typing.Optional[WordObject]:
+    return WordObject.from_dict(choose_response(response)) if response else None
+
+
+def _wrap_numeral(response: typing.List) -> typing.Optional[NumeralObject]:
+    return NumeralObject.from_dict(choose_response(response)) if response else None
+
+
+def _wrap_speller(response: typing.Dict) -> typing.Optional[SpellerObject]:
+    return SpellerObject.from_dict(response) if response else None
+
+
+def _wrap_text(response: typing.List) -> typing.Optional[str]:
+    return response[0].get("text") if response else None
+
+
+_WRAPPERS = {
+    _CORRECT: _wrap_words,
+    _HINT: _wrap_words,
+    _COGNATE: _wrap_words,
+    _SYNONYM: _wrap_words,
+    _WORD: _wrap_word,
+    _SET_FORM: _wrap_word,
+    _NUMERAL: _wrap_numeral,
+    _SPELLER: _wrap_speller,
+    _LAT_TO_CYR: _wrap_text,
+}
 
 
 def _wrap_response(func_name: str, response: typing.Union[typing.Dict, typing.List]):
@@ -346,22 +601,5 @@ def _wrap_response(func_name: str, response: typing.Union[typing.Dict, typing.Li
     :type response: typing.Union[typing.Dict, typing.List]
     :return: API object
     """
-    if func_name in (
-        APIMethod.CORRECT,
-        APIMethod.HINT,
-        APIMethod.COGNATE,
-        APIMethod.SYNONYM,
-    ):
-        return (
-            [WordObject(**word) if word else None for word in response]
-            if response
-            else None
-        )
-    elif func_name in (APIMethod.WORD, APIMethod.SET_FORM):
-        return WordObject(**choose_response(response)) if response else None
-    elif func_name == APIMethod.NUMERAL:
-        return NumeralObject(**choose_response(response)) if response else None
-    elif func_name == APIMethod.SPELLER:
-        return SpellerObject(**response) if response else None
-    elif func_name == APIMethod.LAT_TO_CYR:
-        return response[0].get("text") if response else None
+    wrapper = _WRAPPERS.get(func_name)
+    return wrapper(response) if wrapper is not None else None
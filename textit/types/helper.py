@@ -1,18 +1,102 @@
+import types
+import typing
+
+
 class Item:
     """
     Helper item
 
     If a value is not provided,
-    it will be automatically generated based on a variable's name
+    it will be automatically generated based on a variable's name.
+    On class creation the item replaces itself with a plain string value
     """
 
     def __init__(self, value=None):
         self._value = value
 
-    def __get__(self, instance, owner):
-        return self._value
-
     def __set_name__(self, owner, name):
         if not name.isupper():
             raise NameError("Name for item must be in uppercase!")
-        self._value = self._value or name.lower()
+        if self._value is None:
+            self._value = name.lower()
+        setattr(owner, name, self._value)
+
+
+class FastEnumMeta(type):
+    """
+    Metaclass for lightweight enumerations
+
+    Uppercase class attributes are turned into members,
+    and a member is looked up by its value with a single dict access
+    """
+
+    def __new__(mcs, name, bases, namespace):
+        members = {key: value for key, value in namespace.items() if key.isupper()}
+        for key in members:
+            del namespace[key]
+        namespace.setdefault("__slots__", ())
+        cls = super().__new__(mcs, name, bases, namespace)
+        cls._member_map = {}
+        cls._value2member = {}
+        for key, value in members.items():
+            member = object.__new__(cls)
+            object.__setattr__(member, "name", key)
+            object.__setattr__(member, "value", value)
+            cls._member_map[key] = member
+            cls._value2member.setdefault(value, member)
+            type.__setattr__(cls, key, member)
+        return cls
+
+    def __setattr__(cls, name, value):
+        if name in cls.__dict__.get("_member_map", ()):
+            raise AttributeError(f"Cannot reassign member {name!r}")
+        super().__setattr__(name, value)
+
+    def __delattr__(cls, name):
+        if name in cls.__dict__.get("_member_map", ()):
+            raise AttributeError(f"Cannot delete member {name!r}")
+        super().__delattr__(name)
+
+    @property
+    def __members__(cls) -> typing.Mapping[str, "FastEnum"]:
+        return types.MappingProxyType(cls._member_map)
+
+    def __call__(cls, value):
+        if value.__class__ is cls:
+            return value
+        try:
+            return cls._value2member[value]
+        except KeyError:
+            raise ValueError(f"{value!r} is not a valid {cls.__name__}") from None
+
+    def __getitem__(cls, name):
+        return cls._member_map[name]
+
+    def __iter__(cls):
+        return iter(cls._member_map.values())
+
+    def __len__(cls):
+        return len(cls._member_map)
+
+
+class FastEnum(metaclass=FastEnumMeta):
+    """
+    Base class for lightweight enumerations
+    """
+
+    __slots__ = ("name", "value")
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{self.__class__.__name__} members are read-only")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{self.__class__.__name__} members are read-only")
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__}.{self.name}: {self.value!r}>"
+
+    def __str__(self):
+        return f"{self.__class__.__name__}.{self.name}"
+
+    def __reduce__(self):
+        return self.__class__, (self.value,)
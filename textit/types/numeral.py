@@ -1,3 +1,5 @@
+import typing
+
 from .helper import Item
 
 
@@ -14,13 +16,30 @@ class NumeralFormat:
 
 
 class NumeralObject:
-    number: str = ""
-    text: str = ""
+    __slots__ = ("number", "text")
+
+    number: str
+    text: str
 
     def __init__(self, number: str, text: str):
         self.number = number
         self.text = text
 
+    @classmethod
+    def from_dict(cls, data: typing.Dict) -> "NumeralObject":
+        """
+        Creates an object from API response without keyword arguments binding
+
+        :param data: API response
+        :type data: typing.Dict
+        :return: numeral object
+        :rtype: NumeralObject
+        """
+        obj = object.__new__(cls)
+        obj.number = data.get("number", "")
+        obj.text = data.get("text", "")
+        return obj
+
     @property
     def full_text(self):
         return f"{self.number} {self.text}"
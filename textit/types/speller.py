@@ -1,9 +1,30 @@
+import typing
+
+
 class SpellerObject:
-    word: str = ""
-    position: int = 0
-    correct: list = None
+    __slots__ = ("word", "position", "correct")
+
+    word: str
+    position: int
+    correct: typing.Optional[list]
 
     def __init__(self, word: str, position: int, correct: list = None):
         self.word = word
         self.position = position
         self.correct = correct
+
+    @classmethod
+    def from_dict(cls, data: typing.Dict) -> "SpellerObject":
+        """
+        Creates an object from API response without keyword arguments binding
+
+        :param data: API response
+        :type data: typing.Dict
+        :return: speller object
+        :rtype: SpellerObject
+        """
+        obj = object.__new__(cls)
+        obj.word = data.get("word", "")
+        obj.position = data.get("position", 0)
+        obj.correct = data.get("correct")
+        return obj
@@ -1,8 +1,9 @@
-import enum
-from .helper import Item
+import typing
 
+from .helper import FastEnum, FastEnumMeta, Item
 
-class WordPart(enum.Enum):
+
+class WordPart(FastEnum):
     NOUN = 1
     ADJECTIVE = 2
     VERB = 3
@@ -19,7 +20,7 @@ class WordPart(enum.Enum):
     PREDICATIVE = 14
 
 
-class WordCase(enum.Enum):
+class WordCase(FastEnum):
     NOMINATIVE = 1
     GENITIVE = 2
     DATIVE = 3
@@ -28,42 +29,42 @@ class WordCase(enum.Enum):
     PREPOSITIONAL = 6
 
 
-class WordForm(enum.Enum):
+class WordForm(FastEnum):
     UNDEFINED = 1
     PERSONAL = 2
     FULL = 3
     SHORT = 4
 
 
-class WordGender(enum.Enum):
+class WordGender(FastEnum):
     MASCULINE = 1
     FEMININE = 2
     NEUTER = 3
     COMMON = 4
 
 
-class WordKind(enum.Enum):
+class WordKind(FastEnum):
     IMPERFECT = 1
     PERFECT = 2
 
 
-class WordAnimate(enum.Enum):
+class WordAnimate(FastEnum):
     ANIMATE = 1
     INANIMATE = 2
 
 
-class WordNumber(enum.Enum):
+class WordNumber(FastEnum):
     SINGULAR = 1
     PLURAL = 2
 
 
-class WordPerson(enum.Enum):
+class WordPerson(FastEnum):
     FIRST_PERSON = 1
     SECOND_PERSON = 2
     THIRD_PERSON = 3
 
 
-class WordTense(enum.Enum):
+class WordTense(FastEnum):
     PRESENT = 1
     PAST = 2
     FUTURE = 3
@@ -75,32 +76,115 @@ class WordType:
     UNKNOWN = Item()
 
 
+_ENUM_LOOKUP = {
+    cls: cls._value2member
+    for cls in (
+        WordPart,
+        WordCase,
+        WordForm,
+        WordGender,
+        WordKind,
+        WordAnimate,
+        WordNumber,
+        WordPerson,
+        WordTense,
+    )
+}
+
+
 class WordObject:
-    word: str = ""
-    part = WordPart
-    case = WordCase
-    form = WordForm
-    gender = WordGender
-    kind = WordKind
-    animate = WordAnimate
-    number = WordNumber
-    person = WordPerson
-    tense = WordTense
-    prefix: str = ""
-    base: str = ""
-    interfix: str = ""
-    suffix: str = ""
-    ending: str = ""
-    postfix: str = ""
-    initial: str = ""
-    lemma: str = ""
-    type = WordType()
+    # field name -> default value, or enum class for enum fields
+    _fields = {
+        "word": "",
+        "part": WordPart,
+        "case": WordCase,
+        "form": WordForm,
+        "gender": WordGender,
+        "kind": WordKind,
+        "animate": WordAnimate,
+        "number": WordNumber,
+        "person": WordPerson,
+        "tense": WordTense,
+        "prefix": "",
+        "base": "",
+        "interfix": "",
+        "suffix": "",
+        "ending": "",
+        "postfix": "",
+        "initial": "",
+        "lemma": "",
+        "type": "",
+    }
+    __slots__ = tuple(_fields)
+    _enum_fields = {k: v for k, v in _fields.items() if isinstance(v, FastEnumMeta)}
+    _defaults = {
+        k: None if isinstance(v, FastEnumMeta) else v for k, v in _fields.items()
+    }
+    _valid_fields = frozenset(_fields)
+
+    word: str
+    part: typing.Optional[WordPart]
+    case: typing.Optional[WordCase]
+    form: typing.Optional[WordForm]
+    gender: typing.Optional[WordGender]
+    kind: typing.Optional[WordKind]
+    animate: typing.Optional[WordAnimate]
+    number: typing.Optional[WordNumber]
+    person: typing.Optional[WordPerson]
+    tense: typing.Optional[WordTense]
+    prefix: str
+    base: str
+    interfix: str
+    suffix: str
+    ending: str
+    postfix: str
+    initial: str
+    lemma: str
+    type: str  # one of WordType values
 
     def __init__(self, **kwargs):
-        for key, value in kwargs.items():
-            if hasattr(self, key) and value is not None:
-                attr = self.__getattribute__(key)
-                if isinstance(attr, enum.EnumMeta):
-                    self.__setattr__(key, attr(value))
-                else:
-                    self.__setattr__(key, value)
+        self._load(kwargs)
+
+    @classmethod
+    def from_dict(cls, data: typing.Dict) -> "WordObject":
+        """
+        Creates an object from API response without keyword arguments binding
+
+        :param data: API response
+        :type data: typing.Dict
+        :return: word object
+        :rtype: WordObject
+        """
+        obj = object.__new__(cls)
+        obj._load(data)
+        return obj
+
+    def fill_missing(self, other: "WordObject"):
+        """
+        Copies fields that are not set on this object from another one
+
+        :param other: word object to copy fields from
+        :type other: WordObject
+        """
+        setattr_ = object.__setattr__
+        for key, default in self._defaults.items():
+            if getattr(self, key) == default:
+                setattr_(self, key, getattr(other, key))
+
+    def _load(self, data: typing.Dict):
+        setattr_ = object.__setattr__
+        for key, value in self._defaults.items():
+            setattr_(self, key, value)
+        enum_fields = self._enum_fields
+        valid_fields = self._valid_fields
+        enum_lookup = _ENUM_LOOKUP
+        for key, value in data.items():
+            if value is None or key not in valid_fields:
+                continue
+            enum = enum_fields.get(key)
+            if enum is not None and value.__class__ is not enum:
+                try:
+                    value = enum_lookup[enum][value]
+                except KeyError:
+                    value = enum(value)
+            setattr_(self, key, value)
@@ -1,19 +1,71 @@
 import typing
 from enum import Enum
 
+from .types import exceptions
+from .types.helper import FastEnum
 
-def _normalize(obj):
+_HREF = "https://github.com/prostmich/text-api"  # link where we will use this API
+_PAYLOAD_TEMPLATE = {"commands": None, "href": _HREF}
+
+
+def _prepare_none(arg) -> str:
+    return ""
+
+
+def _prepare_list(arg: typing.List) -> typing.List:
+    prepare = _prepare_arg
+    return [prepare(v) for v in arg]
+
+
+def _prepare_dict(arg: typing.Dict) -> typing.Dict:
+    prepare = _prepare_arg
+    return {k: prepare(v) for k, v in arg.items()}
+
+
+def _prepare_enum(arg: typing.Union[Enum, FastEnum]) -> str:
+    value = arg.value
+    return value if type(value) is str else str(value)
+
+
+_BOOL_STR = ("false", "true")
+
+
+def _prepare_bool(arg: bool) -> str:
+    return _BOOL_STR[arg]
+
+
+def _prepare_as_is(arg):
+    return arg
+
+
+_PREPARERS = {
+    type(None): _prepare_none,
+    str: _prepare_as_is,
+    list: _prepare_list,
+    dict: _prepare_dict,
+    bool: _prepare_bool,
+    int: str,
+}
+
+
+def _find_preparer(cls: type) -> typing.Callable:
     """
-    Normalize dicts and lists
+    Finds a preparer for a type that is not in the dispatch table yet
 
-    :param obj: object to normalize
-    :return: normalized object
+    :param cls: type of argument
+    :return: preparer
     """
-    if isinstance(obj, list):
-        return [_normalize(item) for item in obj]
-    elif isinstance(obj, dict):
-        return {k: _normalize(v) for k, v in obj.items() if v is not None}
-    return obj
+    if issubclass(cls, list):
+        return _prepare_list
+    elif issubclass(cls, dict):
+        return _prepare_dict
+    elif issubclass(cls, (Enum, FastEnum)):
+        return _prepare_enum
+    elif issubclass(cls, bool):
+        return _prepare_bool
+    elif issubclass(cls, int):
+        return str
+    return _prepare_as_is
 
 
 def _prepare_arg(arg):
@@ -23,19 +75,10 @@ def _prepare_arg(arg):
     :param arg: argument for stringify
     :return: prepared argument
     """
-    if arg is None:
-        return ""
-    if isinstance(arg, list):
-        return [_prepare_arg(v) for v in arg]
-    elif isinstance(arg, dict):
-        return {k: _prepare_arg(v) for k, v in arg.items()}
-    elif isinstance(arg, Enum):
-        return str(arg.value)
-    elif isinstance(arg, bool):
-        return str(arg).lower()
-    elif isinstance(arg, int):
-        return str(arg)
-    return arg
+    preparer = _PREPARERS.get(type(arg))
+    if preparer is None:
+        preparer = _PREPARERS[type(arg)] = _find_preparer(type(arg))
+    return preparer(arg)
 
 
 def generate_command(**kwargs) -> typing.Dict:
@@ -46,11 +89,31 @@ def generate_command(**kwargs) -> typing.Dict:
     :return: payload
     :rtype: typing.Dict
     """
-    command = {}
-    for key, value in kwargs.items():
-        if not key.startswith("_") and value is not None:
-            command[key] = _prepare_arg(value)
-    return command
+    prepare = _prepare_arg
+    return {
+        key: prepare(value)
+        for key, value in kwargs.items()
+        if value is not None and key[:1] != "_"
+    }
+
+
+def command_builder(func: str, name: str) -> typing.Callable[[str], typing.Dict]:
+    """
+    Creates a function that generates command with a single string parameter.
+    String values don't need to be prepared, so the command is built directly
+
+    :param func: API method name
+    :type func: str
+    :param name: parameter name
+    :type name: str
+    :return: command generator
+    :rtype: typing.Callable[[str], typing.Dict]
+    """
+
+    def build(value: str) -> typing.Dict:
+        return {"func": func, "pars": {name: value}}
+
+    return build
 
 
 def generate_payload(commands: typing.Union[typing.List, typing.Dict]) -> typing.Dict:
@@ -62,12 +125,9 @@ def generate_payload(commands: typing.Union[typing.List, typing.Dict]) -> typing
     :return: payload
     :rtype: typing.Dict
     """
-    if isinstance(commands, dict):
-        commands = [commands]
-    return {
-        "commands": commands,
-        "href": "https://github.com/prostmich/text-api",  # link where we will use this API
-    }
+    payload = _PAYLOAD_TEMPLATE.copy()
+    payload["commands"] = [commands] if isinstance(commands, dict) else commands
+    return payload
 
 
 def choose_response(
@@ -84,8 +144,8 @@ def choose_response(
     """
     if not responses:
         return None
-    if all([response.get("probability") for response in responses]):
-        responses.sort(key=lambda x: x.get("probability"))
+    if all(response.get("probability") for response in responses):
+        return min(responses, key=lambda x: x["probability"])
     return responses[0]
 
 
@@ -116,3 +176,27 @@ def sign_responses(func_list: typing.List, responses: typing.List) -> typing.Lis
         {"func": func_name, "response": responses[i]}
         for i, func_name in enumerate(func_list)
     ]
+
+
+def sign_responses_from_commands(
+    commands: typing.List, responses: typing.List
+) -> typing.List:
+    """
+    Signs individual API responses with names of the commands they belong to
+
+    :param commands: list of sent commands
+    :type commands: typing.List
+    :param responses: list of API responses
+    :type responses: typing.List
+    :return: list of signed API responses
+    :rtype: typing.List
+    :raises BatchProcessingError: if the number of responses and commands differ
+    """
+    if len(responses) != len(commands):
+        raise exceptions.BatchProcessingError(
+            f"API returned {len(responses)} responses for {len(commands)} commands"
+        )
+    return [
+        {"func": command.get("func"), "response": response}
+        for command, response in zip(commands, responses)
+    ]